@@ -16,28 +16,242 @@ Features:
 Requirements: Python 3.9+ with Tkinter (standard library)
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import json
 import re
 import shutil
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
-import threading
 import platform
-from typing import Optional, Dict, Any
+import functools
+import webbrowser
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Set, Union
+
+# Tkinter is loaded by _import_tk() when the installer window is created, so
+# main() can check the Python version and print its banner before Tcl/Tk loads
+tk = ttk = filedialog = None
+
+
+def _import_tk():
+    """Import Tkinter into the module globals on first use"""
+    global tk, ttk, filedialog
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, filedialog
+
+
+# Oldest supported interpreter
+_MIN_PYTHON = (3, 9)
+
+# Startup compatibility message per sys.platform value
+_PLATFORM_BANNERS = {
+    "win32": "🪟 Windows detected - using Windows-compatible features",
+    "linux": "🐧 Linux detected - using cross-platform features",
+    "darwin": "🍎 macOS detected - using cross-platform features",
+}
+
+# Progress label text for each wizard step
+_STEP_LABELS = tuple(f"Step {i + 1} of 5" for i in range(5))
+
+# Windows and default macOS filesystems ignore case when resolving names
+_CASE_INSENSITIVE_FS = sys.platform in ('win32', 'darwin')
+
+
+def _name_key(name: str) -> str:
+    """Normalise a file name for comparison the way this platform's filesystem does"""
+    return name.lower() if _CASE_INSENSITIVE_FS else name
+
+
+# Marker files checked in priority order by detect_deployment_type
+_DEPLOYMENT_MARKERS = (
+    ("railway.json", "Railway"),
+    ("Procfile", "Heroku"),
+    ("app.yaml", "Google Cloud Platform"),
+    (".gcloudignore", "Google Cloud Platform"),
+    (".ebextensions", "AWS"),
+    ("Dockerrun.aws.json", "AWS"),
+    ("azure-pipelines.yml", "Microsoft Azure"),
+)
+
+# Cloud providers that mark a GitHub Actions workflow as a cloud deployment
+_CLOUD_RE = re.compile(rb'aws|gcp|azure|railway|heroku', re.IGNORECASE)
+
+# First CMD instruction in a Dockerfile (ENTRYPOINT is left untouched); the
+# line terminator, including a CRLF's \r, is not part of the match
+_CMD_RE = re.compile(rb'(?m)^[ \t]*CMD\b[^\r\n]*')
+
+# KEY=value assignments in a .env file; comments and blank lines don't match
+_ENV_RE = re.compile(rb'(?m)^[ \t]*([^#\s=][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$')
+
+# Separates a requirement's package name from its version specifier
+_PKG_SPLIT_RE = re.compile(rb'[>=<~!]')
+
+# Agent templates up to this size are kept in memory after the first read
+_TEMPLATE_CACHE_LIMIT = 1 << 20
+
+
+# Packages the agent needs; identical on every platform
+_REQUIREMENTS_TXT = "psutil\nrequests\npython-dotenv"
+
+# Dockerfile CMD that starts the app and the agent (same format on all platforms)
+_DOCKER_CMD = 'CMD ["sh", "-c", "python app.py > /app.log 2>&1 & sleep 5 && python overcast_agent.py"]'
+
+# Git commands shown in the deployment instructions
+_GIT_COMMANDS = {
+    'add': 'git add .',
+    'commit': 'git commit -m "Add Overcast agent"',
+    'push': 'git push origin main'
+}
+
+# Deployment instructions per detected platform, keyed by deployment type.
+# Placeholders are filled from the git commands and platform Python command.
+_DEPLOYMENT_INSTRUCTIONS = {
+    "Railway": """
+1. 🚂 Commit your changes:
+   {add}
+   {commit}
+
+2. 🚀 Push to Railway:
+   {push}
+
+3. ✅ Your app will redeploy automatically with log monitoring enabled!
+    """.strip(),
+    
+    "Heroku": """
+1. 🟣 Commit your changes:
+   git add .
+   git commit -m "Add Overcast overcast agent"
+
+2. 🚀 Deploy to Heroku:
+   git push heroku main
+
+3. ✅ Your dyno will restart with log monitoring enabled!
+    """.strip(),
+    
+    "Google Cloud Platform": """
+1. ☁️ Deploy to GCP:
+   gcloud app deploy
+
+2. ✅ Your app will redeploy with log monitoring enabled!
+    """.strip(),
+    
+    "AWS": """
+1. ☁️ Rebuild and deploy your Docker container:
+   docker build -t your-app .
+   # Deploy using your AWS deployment method
+
+2. ✅ Your application will restart with log monitoring enabled!
+    """.strip(),
+    
+    "Docker (Custom)": """
+1. 🐳 Rebuild your Docker container:
+   docker build -t your-app .
+
+2. 🚀 Run with environment variables:
+   docker run --env-file .env your-app
+
+3. ✅ Your application will start with log monitoring enabled!
+    """.strip(),
+    
+    "Custom/Local": """
+1. 📦 Install dependencies:
+   {python_cmd} -m pip install -r requirements.txt
+
+2. 🚀 Run your application:
+   {python_cmd} app.py > /app.log 2>&1 &
+   {python_cmd} overcast_agent.py
+
+3. ✅ Your application logs will be forwarded to Overcast!
+    """.strip()
+}
+
+
+def _slurp(path: Union[str, Path]) -> bytes:
+    """Read a whole small file unbuffered; a missing file reads as empty"""
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            # readall sizes its buffer from fstat and loops until EOF
+            return f.readall()
+    except FileNotFoundError:
+        return b""
+
+
+def _spit(path: Path, data: bytes):
+    """Replace a small file's contents with a single os.write"""
+    # O_BINARY stops Windows from translating newlines on a raw fd
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_platform() -> Dict[str, Any]:
+    """Detect the current platform and return platform-specific info (cached)"""
+    # sys.platform is fixed at interpreter build time, unlike platform.system()
+    system = sys.platform
+    
+    platform_info = {
+        'system': system,
+        'is_windows': system == 'win32',
+        'is_linux': system.startswith('linux'),
+        'is_mac': system == 'darwin',
+        'python_cmd': 'python',
+        'shell_cmd': 'bash' if system != 'win32' else 'cmd'
+    }
+    
+    # Determine best Python command
+    if not platform_info['is_windows']:
+        # On Linux/Mac, prefer python3 when it is on PATH
+        if shutil.which('python3'):
+            platform_info['python_cmd'] = 'python3'
+    
+    return platform_info
+
+
+@dataclass
+class ProjectFacts:
+    """Result of a single scan of the selected project directory"""
+    names: Set[str]
+    has_dockerfile: bool
+    deployment: str
+    details: str
 
 
 class OvercastInstaller:
     """Main installer application class"""
     
+    # Fixed window size; the window is not resizable
+    WINDOW_W = 600
+    WINDOW_H = 500
+    
+    # Installation tasks run in order: (start message, method name, done message)
+    INSTALL_TASKS = (
+        ("📄 Copying overcast_agent.py...", "copy_log_forwarder", "✅ Log forwarder copied successfully\n"),
+        ("📁 Creating logs directory...", "create_logs_directory", "✅ Logs directory created\n"),
+        ("🔧 Configuring environment variables...", "create_env_file", "✅ Environment configuration updated\n"),
+        ("🐳 Configuring Docker integration...", "handle_dockerfile", "✅ Docker configuration complete\n"),
+        ("📦 Checking Python dependencies...", "handle_requirements", "✅ Dependencies configured\n"),
+    )
+    
     def __init__(self):
+        _import_tk()
         self.root = tk.Tk()
         # Set title with platform indicator
         platform_name = platform.system()
         self.root.title(f"Overcast Agent Installer ({platform_name})")
-        self.root.geometry("600x500")
+        
+        # Size and center the window in one geometry call
+        x = (self.root.winfo_screenwidth() - self.WINDOW_W) // 2
+        y = (self.root.winfo_screenheight() - self.WINDOW_H) // 2
+        self._center_geom = f"{self.WINDOW_W}x{self.WINDOW_H}+{x}+{y}"
+        self.root.geometry(self._center_geom)
         self.root.resizable(False, False)
         
         # Apply dark theme colors
@@ -46,34 +260,56 @@ class OvercastInstaller:
         # Configure ttk styles for dark theme
         self.style = ttk.Style()
         self.style.theme_use('clam')
-        
-        # Configure dark theme colors
-        self.style.configure('TFrame', background='#0d1117')
-        self.style.configure('TLabel', background='#0d1117', foreground='#e6edf3', font=('SF Mono', 10))
-        self.style.configure('Title.TLabel', background='#0d1117', foreground='#e6edf3', font=('SF Mono', 16, 'bold'))
-        self.style.configure('TButton', background='#21262d', foreground='#e6edf3', borderwidth=1, relief='solid')
-        self.style.map('TButton', 
-                      background=[('active', '#30363d'), ('pressed', '#58a6ff')],
-                      foreground=[('active', '#e6edf3')])
-        self.style.configure('TEntry', fieldbackground='#161b22', foreground='#e6edf3', borderwidth=1, 
-                           insertcolor='#e6edf3', selectbackground='#58a6ff')
-        self.style.configure('TProgressbar', background='#58a6ff', troughcolor='#21262d', borderwidth=0)
+        self._configure_styles()
         
         # Application state
         self.current_step = 0
         self.api_key = ""
         self.project_path = ""
         self.deployment_type = ""
+        self.facts: Optional[ProjectFacts] = None
+        
+        # Agent template shipped next to the installer, cached if small
+        self._template_path = Path(__file__).resolve().parent / "overcast_agent_template.py"
+        self._template_bytes: Optional[bytes] = None
+        try:
+            if self._template_path.stat().st_size <= _TEMPLATE_CACHE_LIMIT:
+                self._template_bytes = _slurp(self._template_path)
+        except OSError:
+            pass
         
         # UI components
         self.setup_ui()
+        self._build_message_dialog()
         
         # Platform detection
-        self.platform_info = self._detect_platform()
+        self.platform_info = _detect_platform()
+        self._instructions = self._build_instructions()
         
         # Start with step 1
         self.show_step(0)
     
+    def _configure_styles(self):
+        """Register every ttk style used by the steps once, up front"""
+        # Configure dark theme colors
+        self.style.configure('TFrame', background='#0d1117')
+        self.style.configure('TLabel', background='#0d1117', foreground='#e6edf3', font=('SF Mono', 10))
+        self.style.configure('Title.TLabel', background='#0d1117', foreground='#e6edf3', font=('SF Mono', 16, 'bold'))
+        self.style.configure('TButton', background='#21262d', foreground='#e6edf3', borderwidth=1, relief='solid')
+        self.style.map('TButton', 
+                      background=[('active', '#30363d'), ('pressed', '#58a6ff')],
+                      foreground=[('active', '#e6edf3')])
+        self.style.configure('TEntry', fieldbackground='#161b22', foreground='#e6edf3', borderwidth=1, 
+                           insertcolor='#e6edf3', selectbackground='#58a6ff')
+        self.style.configure('TProgressbar', background='#58a6ff', troughcolor='#21262d', borderwidth=0)
+        
+        # Step-specific styles
+        self.style.configure('Header.TLabel', background='#0d1117', foreground='#e6edf3', font=('SF Mono', 12, 'bold'))
+        self.style.configure('Help.TLabel', background='#0d1117', foreground='#8b949e', font=('SF Mono', 9))
+        self.style.configure('Success.TLabel', background='#0d1117', foreground='#238636', font=('SF Mono', 14, 'bold'))
+        self.style.configure('TLabelframe', background='#0d1117', borderwidth=1, relief='solid')
+        self.style.configure('TLabelframe.Label', background='#0d1117', foreground='#58a6ff', font=('SF Mono', 10, 'bold'))
+    
     def setup_ui(self):
         """Setup the main UI structure"""
         # Main container
@@ -98,7 +334,7 @@ class OvercastInstaller:
         self.progress_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         self.progress_frame.columnconfigure(0, weight=1)
         
-        self.progress_var = tk.DoubleVar()
+        self.progress_var = tk.IntVar()
         self.progress_bar = ttk.Progressbar(
             self.progress_frame, 
             variable=self.progress_var, 
@@ -108,16 +344,31 @@ class OvercastInstaller:
         
         self.progress_label = ttk.Label(
             self.progress_frame, 
-            text="Step 1 of 5"
+            text=_STEP_LABELS[0]
         )
         self.progress_label.grid(row=1, column=0, pady=(5, 0))
         
-        # Content frame (will be replaced for each step)
+        # Content frame holding one pre-built frame per step
         self.content_frame = ttk.Frame(self.main_frame)
         self.content_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 20))
         self.content_frame.columnconfigure(0, weight=1)
+        self.content_frame.rowconfigure(0, weight=1)
         self.main_frame.rowconfigure(2, weight=1)
         
+        # Build every step once; show_step only toggles which frame is gridded
+        self._step_frames = []
+        for build_step in (
+            self._build_api_key_step,
+            self._build_project_selection_step,
+            self._build_deployment_detection_step,
+            self._build_installation_step,
+            self._build_completion_step,
+        ):
+            frame = ttk.Frame(self.content_frame)
+            frame.columnconfigure(0, weight=1)
+            build_step(frame)
+            self._step_frames.append(frame)
+        
         # Button frame
         self.button_frame = ttk.Frame(self.main_frame)
         self.button_frame.grid(row=3, column=0, sticky=(tk.W, tk.E))
@@ -140,21 +391,68 @@ class OvercastInstaller:
         # Add spacing column
         self.button_frame.columnconfigure(1, weight=1)
     
+    def _build_message_dialog(self):
+        """Create the hidden modal dialog that _show_message reuses"""
+        self._message_dialog = tk.Toplevel(self.root)
+        self._message_dialog.withdraw()
+        self._message_dialog.transient(self.root)
+        self._message_dialog.resizable(False, False)
+        self._message_dialog.configure(bg='#0d1117')
+        self._message_dialog.protocol("WM_DELETE_WINDOW", self._dismiss_message)
+        # Close on Enter/Escape like the native messagebox
+        self._message_dialog.bind("<Return>", lambda e: self._dismiss_message())
+        self._message_dialog.bind("<Escape>", lambda e: self._dismiss_message())
+        
+        message_frame = ttk.Frame(self._message_dialog, padding="20")
+        message_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self._message_label = ttk.Label(message_frame, wraplength=360, justify="left")
+        self._message_label.grid(row=0, column=0, pady=(0, 15))
+        
+        ttk.Button(message_frame, text="OK", command=self._dismiss_message).grid(row=1, column=0)
+        
+        self._message_closed = tk.BooleanVar()
+        self._message_prev_focus = None
+    
+    def _show_error(self, title: str, message: str):
+        """Show a modal error over the installer window and wait for OK"""
+        self._show_message(title, f"❌ {message}")
+    
+    def _show_message(self, title: str, message: str):
+        """Show a modal message over the installer window and wait for OK"""
+        self._message_dialog.title(title)
+        self._message_label.config(text=message)
+        self._message_dialog.geometry(f"+{self.root.winfo_rootx() + 100}+{self.root.winfo_rooty() + 150}")
+        self._message_dialog.deiconify()
+        # Remember who had focus so it can be handed back on dismiss
+        self._message_prev_focus = self.root.focus_get()
+        # The grab fails on X11 until the window is actually mapped
+        self._message_dialog.wait_visibility()
+        self._message_dialog.grab_set()
+        self._message_dialog.focus_set()
+        self.root.wait_variable(self._message_closed)
+    
+    def _dismiss_message(self):
+        """Hide the message dialog and release the caller of _show_message"""
+        self._message_dialog.grab_release()
+        self._message_dialog.withdraw()
+        if self._message_prev_focus is not None:
+            self._message_prev_focus.focus_set()
+            self._message_prev_focus = None
+        self._message_closed.set(True)
+    
     def show_step(self, step_num: int):
         """Show the specified step"""
+        self._step_frames[self.current_step].grid_remove()
+        self._step_frames[step_num].grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
         self.current_step = step_num
         self.progress_var.set(step_num + 1)
-        self.progress_label.config(text=f"Step {step_num + 1} of 5")
+        self.progress_label.config(text=_STEP_LABELS[step_num])
         
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Show appropriate step
+        # Refresh steps whose content depends on earlier choices
         if step_num == 0:
-            self.show_api_key_step()
-        elif step_num == 1:
-            self.show_project_selection_step()
+            self.api_key_entry.focus()
         elif step_num == 2:
             self.show_deployment_detection_step()
         elif step_num == 3:
@@ -169,32 +467,29 @@ class OvercastInstaller:
         else:
             self.next_button.config(text="Next →", command=self.go_next)
     
-    def show_api_key_step(self):
+    def _build_api_key_step(self, frame: ttk.Frame):
         """Step 1: API Key Input"""
-        header_label = ttk.Label(
-            self.content_frame,
-            text="🔑 Enter your Overcast API Key"
-        )
-        self.style.configure('Header.TLabel', background='#0d1117', foreground='#e6edf3', font=('SF Mono', 12, 'bold'))
-        header_label.configure(style='Header.TLabel')
-        header_label.grid(row=0, column=0, pady=(0, 10))
+        ttk.Label(
+            frame,
+            text="🔑 Enter your Overcast API Key",
+            style='Header.TLabel'
+        ).grid(row=0, column=0, pady=(0, 10))
         
         ttk.Label(
-            self.content_frame,
+            frame,
             text="You can get your API key from the Overcast dashboard:",
             wraplength=500
         ).grid(row=1, column=0, pady=(0, 5))
         
         # API key input
         self.api_key_var = tk.StringVar(value=self.api_key)
-        api_key_entry = ttk.Entry(
-            self.content_frame,
+        self.api_key_entry = ttk.Entry(
+            frame,
             textvariable=self.api_key_var,
             width=50,
             show="*"
         )
-        api_key_entry.grid(row=2, column=0, pady=(10, 10))
-        api_key_entry.focus()
+        self.api_key_entry.grid(row=2, column=0, pady=(10, 10))
         
         # Help text
         help_text = """
@@ -204,32 +499,30 @@ logs to the Overcast monitoring dashboard.
 Your customer account will be automatically identified from your API key.
         """
         
-        help_label = ttk.Label(
-            self.content_frame,
+        ttk.Label(
+            frame,
             text=help_text.strip(),
             wraplength=500,
-            justify="left"
-        )
-        self.style.configure('Help.TLabel', background='#0d1117', foreground='#8b949e', font=('SF Mono', 9))
-        help_label.configure(style='Help.TLabel')
-        help_label.grid(row=3, column=0, pady=(20, 0))
+            justify="left",
+            style='Help.TLabel'
+        ).grid(row=3, column=0, pady=(20, 0))
     
-    def show_project_selection_step(self):
+    def _build_project_selection_step(self, frame: ttk.Frame):
         """Step 2: Project Directory Selection"""
         ttk.Label(
-            self.content_frame,
+            frame,
             text="📁 Select Your Project Directory",
             font=("Arial", 12, "bold")
         ).grid(row=0, column=0, pady=(0, 10))
         
         ttk.Label(
-            self.content_frame,
+            frame,
             text="Choose the root directory of your application project:",
             wraplength=500
         ).grid(row=1, column=0, pady=(0, 20))
         
         # Directory selection frame
-        dir_frame = ttk.Frame(self.content_frame)
+        dir_frame = ttk.Frame(frame)
         dir_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         dir_frame.columnconfigure(0, weight=1)
         
@@ -259,73 +552,64 @@ We'll automatically detect your deployment platform and integrate
 the overcast agent accordingly.
         """
         
-        help_label2 = ttk.Label(
-            self.content_frame,
+        ttk.Label(
+            frame,
             text=help_text.strip(),
             wraplength=500,
-            justify="left"
-        )
-        help_label2.configure(style='Help.TLabel')
-        help_label2.grid(row=3, column=0, pady=(20, 0))
+            justify="left",
+            style='Help.TLabel'
+        ).grid(row=3, column=0, pady=(20, 0))
     
-    def show_deployment_detection_step(self):
+    def _build_deployment_detection_step(self, frame: ttk.Frame):
         """Step 3: Deployment Type Detection"""
         ttk.Label(
-            self.content_frame,
+            frame,
             text="🔍 Deployment Platform Detection",
             font=("Arial", 12, "bold")
         ).grid(row=0, column=0, pady=(0, 10))
         
-        # Run detection
-        self.deployment_type = self.detect_deployment_type()
-        
         # Show results
-        result_frame = ttk.LabelFrame(self.content_frame, text="Detection Results", padding="15")
-        self.style.configure('TLabelframe', background='#0d1117', borderwidth=1, relief='solid')
-        self.style.configure('TLabelframe.Label', background='#0d1117', foreground='#58a6ff', font=('SF Mono', 10, 'bold'))
+        result_frame = ttk.LabelFrame(frame, text="Detection Results", padding="15")
         result_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(10, 20))
         result_frame.columnconfigure(0, weight=1)
         
-        platform_text = f"🎯 Detected Platform: {self.deployment_type}"
-        ttk.Label(
+        self.platform_label = ttk.Label(
             result_frame,
-            text=platform_text,
             font=("Arial", 11, "bold")
-        ).grid(row=0, column=0, pady=(0, 10))
+        )
+        self.platform_label.grid(row=0, column=0, pady=(0, 10))
         
         # Show what was found
-        detection_details = self.get_detection_details()
-        ttk.Label(
+        self.details_label = ttk.Label(
             result_frame,
-            text=detection_details,
             wraplength=500,
             justify="left"
-        ).grid(row=1, column=0)
+        )
+        self.details_label.grid(row=1, column=0)
         
         # Installation preview
-        preview_frame = ttk.LabelFrame(self.content_frame, text="Installation Preview", padding="15")
+        preview_frame = ttk.LabelFrame(frame, text="Installation Preview", padding="15")
         preview_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         preview_frame.columnconfigure(0, weight=1)
         
-        preview_text = self.get_installation_preview()
-        ttk.Label(
+        self.preview_label = ttk.Label(
             preview_frame,
-            text=preview_text,
             wraplength=250,
             justify="left"
-        ).grid(row=0, column=0)
+        )
+        self.preview_label.grid(row=0, column=0)
     
-    def show_installation_step(self):
+    def _build_installation_step(self, frame: ttk.Frame):
         """Step 4: Perform Installation"""
         ttk.Label(
-            self.content_frame,
+            frame,
             text="⚙️ Installing Overcast Agent",
             font=("Arial", 12, "bold")
         ).grid(row=0, column=0, pady=(0, 20))
         
         # Progress text widget
         self.install_text = tk.Text(
-            self.content_frame,
+            frame,
             height=15,
             width=70,
             wrap=tk.WORD,
@@ -341,49 +625,40 @@ the overcast agent accordingly.
         self.install_text.grid(row=1, column=0, pady=(0, 20))
         
         # Scrollbar for text widget
-        scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=self.install_text.yview)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.install_text.yview)
         scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
         self.install_text.configure(yscrollcommand=scrollbar.set)
-        
-        # Disable next button during installation
-        self.next_button.config(state="disabled")
-        
-        # Start installation in a separate thread
-        threading.Thread(target=self.perform_installation, daemon=True).start()
     
-    def show_completion_step(self):
+    def _build_completion_step(self, frame: ttk.Frame):
         """Step 5: Show completion and deployment instructions"""
-        success_label = ttk.Label(
-            self.content_frame,
-            text="🎉 Installation Complete!"
-        )
-        self.style.configure('Success.TLabel', background='#0d1117', foreground='#238636', font=('SF Mono', 14, 'bold'))
-        success_label.configure(style='Success.TLabel')
-        success_label.grid(row=0, column=0, pady=(0, 20))
+        ttk.Label(
+            frame,
+            text="🎉 Installation Complete!",
+            style='Success.TLabel'
+        ).grid(row=0, column=0, pady=(0, 20))
         
         # Success message
         ttk.Label(
-            self.content_frame,
+            frame,
             text="The Overcast Agent has been successfully installed into your project.",
             wraplength=500,
             justify="center"
         ).grid(row=1, column=0, pady=(0, 20))
         
         # Deployment instructions
-        instructions_frame = ttk.LabelFrame(self.content_frame, text="Next Steps", padding="15")
+        instructions_frame = ttk.LabelFrame(frame, text="Next Steps", padding="15")
         instructions_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         instructions_frame.columnconfigure(0, weight=1)
         
-        instructions = self.get_deployment_instructions()
-        ttk.Label(
+        self.instructions_label = ttk.Label(
             instructions_frame,
-            text=instructions,
             wraplength=500,
             justify="left"
-        ).grid(row=0, column=0)
+        )
+        self.instructions_label.grid(row=0, column=0)
         
         # Dashboard link
-        dashboard_frame = ttk.LabelFrame(self.content_frame, text="Dashboard Access", padding="15")
+        dashboard_frame = ttk.LabelFrame(frame, text="Dashboard Access", padding="15")
         dashboard_frame.grid(row=3, column=0, sticky=(tk.W, tk.E))
         dashboard_frame.columnconfigure(0, weight=1)
         
@@ -403,6 +678,27 @@ the overcast agent accordingly.
         dashboard_link.grid(row=1, column=0)
         dashboard_link.bind("<Button-1>", lambda e: self.open_url(dashboard_url))
     
+    def show_deployment_detection_step(self):
+        """Step 3: Run detection and refresh the results"""
+        # Scan the project once; detection, details and preview all read from it
+        self.facts = self._scan_project()
+        self.deployment_type = self.facts.deployment
+        
+        self.platform_label.config(text=f"🎯 Detected Platform: {self.deployment_type}")
+        self.details_label.config(text=self.get_detection_details())
+        self.preview_label.config(text=self.get_installation_preview())
+    
+    def show_installation_step(self):
+        """Step 4: Start the installation"""
+        # Disable next button during installation
+        self.next_button.config(state="disabled")
+        
+        self.perform_installation()
+    
+    def show_completion_step(self):
+        """Step 5: Refresh the deployment instructions"""
+        self.instructions_label.config(text=self.get_deployment_instructions())
+    
     def browse_project_directory(self):
         """Open directory browser for project selection"""
         directory = filedialog.askdirectory(
@@ -413,54 +709,56 @@ the overcast agent accordingly.
         if directory:
             self.project_path = directory
             self.project_path_var.set(directory)
+            self.facts = None
     
-    def detect_deployment_type(self) -> str:
-        """Auto-detect deployment platform based on project files"""
+    def _scan_project(self) -> ProjectFacts:
+        """List the project directory once and derive all detection results"""
         if not self.project_path:
-            return "Unknown"
-        
-        project_dir = Path(self.project_path)
-        
-        # Check for Railway
-        if (project_dir / "railway.json").exists():
-            return "Railway"
-        
-        # Check for Heroku
-        if (project_dir / "Procfile").exists():
-            return "Heroku"
+            return ProjectFacts(set(), False, "Unknown", "No project directory selected.")
         
-        # Check for GCP App Engine
-        if (project_dir / "app.yaml").exists() or (project_dir / ".gcloudignore").exists():
-            return "Google Cloud Platform"
-        
-        # Check for AWS
-        if (project_dir / ".ebextensions").exists() or (project_dir / "Dockerrun.aws.json").exists():
-            return "AWS"
-        
-        # Check for Azure
-        if (project_dir / "azure-pipelines.yml").exists():
-            return "Microsoft Azure"
+        try:
+            with os.scandir(self.project_path) as it:
+                names = {_name_key(entry.name) for entry in it}
+        except OSError:
+            return ProjectFacts(set(), False, "Unknown", "Project directory could not be read.")
+        
+        return ProjectFacts(
+            names=names,
+            has_dockerfile=_name_key("Dockerfile") in names,
+            deployment=self.detect_deployment_type(names),
+            details=self._format_detection_details(names)
+        )
+    
+    def detect_deployment_type(self, names: Set[str]) -> str:
+        """Auto-detect deployment platform from the project's file names"""
+        for marker, deployment in _DEPLOYMENT_MARKERS:
+            if _name_key(marker) in names:
+                return deployment
         
         # Check for GitHub Actions with cloud deployment
-        github_dir = project_dir / ".github" / "workflows"
-        if github_dir.exists():
-            for workflow_file in github_dir.glob("*.yml"):
-                content = workflow_file.read_text().lower()
-                if any(cloud in content for cloud in ["aws", "gcp", "azure", "railway", "heroku"]):
-                    return "GitHub Actions + Cloud"
+        if _name_key(".github") in names:
+            # Unreadable or missing workflows are ignored, as Path.glob did
+            try:
+                with os.scandir(os.path.join(self.project_path, ".github", "workflows")) as it:
+                    for entry in it:
+                        if _name_key(entry.name).endswith((".yml", ".yaml")) and entry.is_file():
+                            try:
+                                content = _slurp(entry.path)
+                            except OSError:
+                                continue
+                            if _CLOUD_RE.search(content):
+                                return "GitHub Actions + Cloud"
+            except OSError:
+                pass
         
         # Check for Docker
-        if (project_dir / "Dockerfile").exists():
+        if _name_key("Dockerfile") in names:
             return "Docker (Custom)"
         
         return "Custom/Local"
     
-    def get_detection_details(self) -> str:
-        """Get detailed information about what was detected"""
-        if not self.project_path:
-            return "No project directory selected."
-        
-        project_dir = Path(self.project_path)
+    def _format_detection_details(self, names: Set[str]) -> str:
+        """Describe which known configuration files are present"""
         details = []
         
         # Check specific files found
@@ -475,7 +773,7 @@ the overcast agent accordingly.
         ]
         
         for filename, description in check_files:
-            if (project_dir / filename).exists():
+            if _name_key(filename) in names:
                 files_found.append(f"✅ {description} ({filename})")
         
         if files_found:
@@ -486,6 +784,12 @@ the overcast agent accordingly.
         
         return "\n".join(details)
     
+    def get_detection_details(self) -> str:
+        """Get detailed information about what was detected"""
+        if self.facts is None:
+            return "No project directory selected."
+        return self.facts.details
+    
     def get_installation_preview(self) -> str:
         """Get preview of what will be installed"""
         actions = [
@@ -494,7 +798,7 @@ the overcast agent accordingly.
             "🔧 Create/update .env file with API key",
         ]
         
-        if Path(self.project_path) / "Dockerfile" if self.project_path else False:
+        if self.facts is not None and self.facts.has_dockerfile:
             actions.append("🐳 Modify existing Dockerfile to run overcast agent")
         else:
             actions.append("ℹ️  No Dockerfile found - Docker integration will be skipped")
@@ -504,98 +808,81 @@ the overcast agent accordingly.
         return "\n".join(actions)
     
     def perform_installation(self):
-        """Perform the actual installation"""
-        try:
-            self.log_install("🚀 Starting Overcast Agent installation...\n")
-            
-            # Step 1: Copy overcast_agent.py
-            self.log_install("📄 Copying overcast_agent.py...")
-            self.copy_log_forwarder()
-            self.log_install("✅ Log forwarder copied successfully\n")
-            
-            # Step 2: Create logs directory
-            self.log_install("📁 Creating logs directory...")
-            self.create_logs_directory()
-            self.log_install("✅ Logs directory created\n")
-            
-            # Step 3: Create/update .env file
-            self.log_install("🔧 Configuring environment variables...")
-            self.create_env_file()
-            self.log_install("✅ Environment configuration updated\n")
-            
-            # Step 4: Handle Dockerfile
-            self.log_install("🐳 Configuring Docker integration...")
-            self.handle_dockerfile()
-            self.log_install("✅ Docker configuration complete\n")
-            
-            # Step 5: Create requirements.txt if needed
-            self.log_install("📦 Checking Python dependencies...")
-            self.handle_requirements()
-            self.log_install("✅ Dependencies configured\n")
-            
+        """Perform the actual installation, one task per event-loop turn"""
+        self.log_install("🚀 Starting Overcast Agent installation...\n")
+        self.root.after(0, self._install_step, 0)
+    
+    def _install_step(self, index: int):
+        """Run installation task `index`, then schedule the next one"""
+        if index == len(self.INSTALL_TASKS):
             self.log_install("🎉 Installation completed successfully!")
             self.log_install("\n✨ Your project is now ready for deployment with Overcast monitoring!")
             
             # Enable next button
-            self.root.after(0, lambda: self.next_button.config(state="normal"))
-            
+            self.next_button.config(state="normal")
+            return
+        
+        start_message, task, done_message = self.INSTALL_TASKS[index]
+        try:
+            self.log_install(start_message)
+            getattr(self, task)()
+            self.log_install(done_message)
+        
         except Exception as e:
             self.log_install(f"\n❌ Installation failed: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror("Installation Error", f"Installation failed: {str(e)}"))
-            self.root.after(0, lambda: self.next_button.config(state="normal"))
+            self._show_error("Installation Error", f"Installation failed: {str(e)}")
+            self.next_button.config(state="normal")
+            return
+        
+        # Yield to the event loop so the UI repaints between tasks
+        self.root.after(1, self._install_step, index + 1)
     
     def log_install(self, message: str):
         """Log installation progress to the text widget"""
-        def update_text():
-            self.install_text.insert(tk.END, message + "\n")
-            self.install_text.see(tk.END)
-            self.install_text.update()
-        
-        self.root.after(0, update_text)
+        self.install_text.insert(tk.END, message + "\n")
+        self.install_text.see(tk.END)
     
     def copy_log_forwarder(self):
         """Copy the overcast agent template to the project"""
-        template_path = Path(__file__).parent / "overcast_agent_template.py"
         target_path = Path(self.project_path) / "overcast_agent.py"
         
-        if not template_path.exists():
+        if self._template_bytes is not None:
+            _spit(target_path, self._template_bytes)
+        elif self._template_path.is_file():
+            # Contents only; copyfile uses sendfile/fcopyfile where available
+            shutil.copyfile(self._template_path, target_path)
+        else:
             raise FileNotFoundError("overcast_agent_template.py not found in installer directory")
-        
-        shutil.copy2(template_path, target_path)
     
     def create_logs_directory(self):
         """Create logs directory if it doesn't exist"""
         logs_dir = Path(self.project_path) / "logs"
         logs_dir.mkdir(exist_ok=True)
         
-        # Create a .gitkeep file
-        gitkeep_file = logs_dir / ".gitkeep"
-        gitkeep_file.touch()
+        # Create a .gitkeep file so an empty logs/ is still tracked
+        with os.scandir(logs_dir) as it:
+            if next(it, None) is None:
+                (logs_dir / ".gitkeep").touch()
     
     def create_env_file(self):
         """Create or update .env file with configuration"""
         env_path = Path(self.project_path) / ".env"
         
         # Read existing .env if it exists
-        existing_vars = {}
-        if env_path.exists():
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        existing_vars[key.strip()] = value.strip()
+        raw = _slurp(env_path)
+        existing_vars = dict(_ENV_RE.findall(raw))
         
         # Set/update Overcast variables  
-        existing_vars['OVERCAST_API_KEY'] = self.api_key_var.get().strip()
-        existing_vars['OVERCAST_DASHBOARD_URL'] = 'https://dashboard.overcastsre.com'
-        existing_vars['OVERCAST_LOG_FILE'] = '/app.log'
+        existing_vars[b'OVERCAST_API_KEY'] = self.api_key_var.get().strip().encode()
+        existing_vars[b'OVERCAST_DASHBOARD_URL'] = b'https://dashboard.overcastsre.com'
+        existing_vars[b'OVERCAST_LOG_FILE'] = b'/app.log'
         
         # Write updated .env file
-        with open(env_path, 'w') as f:
-            f.write("# Overcast Agent Configuration\n")
-            for key, value in existing_vars.items():
-                f.write(f"{key}={value}\n")
+        _spit(
+            env_path,
+            b"# Overcast Agent Configuration\n"
+            + b"".join(key + b"=" + value + b"\n" for key, value in existing_vars.items())
+        )
     
     def handle_dockerfile(self):
         """Modify existing Dockerfile to integrate overcast agent"""
@@ -609,74 +896,47 @@ the overcast agent accordingly.
     
     def modify_existing_dockerfile(self, dockerfile_path: Path):
         """Modify existing Dockerfile to run overcast agent"""
-        with open(dockerfile_path, 'r') as f:
-            content = f.read()
+        content = _slurp(dockerfile_path)
         
         # Check if already modified
-        if 'overcast_agent.py' in content:
+        if b'overcast_agent.py' in content:
             self.log_install("ℹ️  Dockerfile already contains overcast agent integration")
             return
         
-        # Find the CMD or ENTRYPOINT line and modify it
-        lines = content.split('\n')
-        modified = False
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith('CMD') or stripped.startswith('ENTRYPOINT'):
-                # Extract the command
-                if stripped.startswith('CMD'):
-                    # Replace with platform-appropriate command format
-                    new_cmd = self._get_platform_docker_cmd()
-                    lines[i] = new_cmd
-                    modified = True
-                    break
-        
-        if not modified:
-            # Add our own CMD if none found
-            lines.append('')
-            lines.append('# Overcast Agent Integration')
-            lines.append(self._get_platform_docker_cmd())
+        # Replace the first CMD line with the platform-appropriate command
+        new_cmd = _DOCKER_CMD.encode()
+        content, replaced = _CMD_RE.subn(lambda _: new_cmd, content, count=1)
+        
+        if not replaced:
+            # Add our own CMD if none found, matching the file's line endings
+            eol = b'\r\n' if b'\r\n' in content else b'\n'
+            content += eol + eol + b'# Overcast Agent Integration' + eol + new_cmd
         
         # Write modified Dockerfile
-        with open(dockerfile_path, 'w') as f:
-            f.write('\n'.join(lines))
-    
-
+        _spit(dockerfile_path, content)
     
     def handle_requirements(self):
         """Ensure required packages are in requirements.txt"""
         requirements_path = Path(self.project_path) / "requirements.txt"
         
-        required_packages = [
-            'psutil',
-            'requests',
-            'python-dotenv'
-        ]
+        required_packages = _REQUIREMENTS_TXT.split('\n')
         
-        existing_requirements = set()
-        if requirements_path.exists():
-            with open(requirements_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        # Extract package name (before any version specifier)
-                        package_name = re.split(r'[>=<~!]', line)[0].strip()
-                        existing_requirements.add(package_name.lower())
+        raw = _slurp(requirements_path)
+        # Package names (before any version specifier) of non-comment lines
+        existing_requirements = {
+            _PKG_SPLIT_RE.split(line, 1)[0].strip().lower()
+            for line in map(bytes.strip, raw.splitlines())
+            if line and not line.startswith(b'#')
+        }
         
         # Add missing packages
-        missing_packages = []
-        for package in required_packages:
-            if package.lower() not in existing_requirements:
-                missing_packages.append(package)
+        missing_packages = [p for p in required_packages if p.lower().encode() not in existing_requirements]
         
         if missing_packages:
-            with open(requirements_path, 'a') as f:
-                f.write('\n# Overcast Agent Dependencies\n')
-                requirements_text = self._get_platform_specific_requirements()
-                for line in requirements_text.split('\n'):
-                    if line.strip() in missing_packages:
-                        f.write(f'{line.strip()}\n')
+            _spit(
+                requirements_path,
+                raw + b'\n# Overcast Agent Dependencies\n' + '\n'.join(missing_packages).encode() + b'\n'
+            )
             
             self.log_install(f"📦 Added dependencies: {', '.join(missing_packages)}")
         else:
@@ -684,69 +944,12 @@ the overcast agent accordingly.
     
     def get_deployment_instructions(self) -> str:
         """Get platform-specific deployment instructions"""
-        git_commands = self._get_platform_git_commands()
-        
-        instructions = {
-            "Railway": f"""
-1. 🚂 Commit your changes:
-   {git_commands['add']}
-   {git_commands['commit']}
-
-2. 🚀 Push to Railway:
-   {git_commands['push']}
-
-3. ✅ Your app will redeploy automatically with log monitoring enabled!
-            """.strip(),
-            
-            "Heroku": """
-1. 🟣 Commit your changes:
-   git add .
-   git commit -m "Add Overcast overcast agent"
-
-2. 🚀 Deploy to Heroku:
-   git push heroku main
-
-3. ✅ Your dyno will restart with log monitoring enabled!
-            """.strip(),
-            
-            "Google Cloud Platform": """
-1. ☁️ Deploy to GCP:
-   gcloud app deploy
-
-2. ✅ Your app will redeploy with log monitoring enabled!
-            """.strip(),
-            
-            "AWS": """
-1. ☁️ Rebuild and deploy your Docker container:
-   docker build -t your-app .
-   # Deploy using your AWS deployment method
-
-2. ✅ Your application will restart with log monitoring enabled!
-            """.strip(),
-            
-            "Docker (Custom)": """
-1. 🐳 Rebuild your Docker container:
-   docker build -t your-app .
-
-2. 🚀 Run with environment variables:
-   docker run --env-file .env your-app
-
-3. ✅ Your application will start with log monitoring enabled!
-            """.strip(),
-            
-            "Custom/Local": f"""
-1. 📦 Install dependencies:
-   {self.platform_info['python_cmd']} -m pip install -r requirements.txt
-
-2. 🚀 Run your application:
-   {self.platform_info['python_cmd']} app.py > /app.log 2>&1 &
-   {self.platform_info['python_cmd']} overcast_agent.py
-
-3. ✅ Your application logs will be forwarded to Overcast!
-            """.strip()
-        }
-        
-        return instructions.get(self.deployment_type, instructions["Custom/Local"])
+        return self._instructions.get(self.deployment_type, self._instructions["Custom/Local"])
+    
+    def _build_instructions(self) -> Dict[str, str]:
+        """Render the deployment instructions for every platform once"""
+        fields = dict(self._get_platform_git_commands(), python_cmd=self.platform_info['python_cmd'])
+        return {name: text.format(**fields) for name, text in _DEPLOYMENT_INSTRUCTIONS.items()}
     
     def go_next(self):
         """Move to next step with validation"""
@@ -754,7 +957,7 @@ the overcast agent accordingly.
             # Validate API key
             api_key = self.api_key_var.get().strip()
             if not api_key:
-                messagebox.showerror("Validation Error", "Please enter your Overcast API key.")
+                self._show_error("Validation Error", "Please enter your Overcast API key.")
                 return
             
             self.api_key = api_key
@@ -762,11 +965,11 @@ the overcast agent accordingly.
         elif self.current_step == 1:
             # Validate project path
             if not self.project_path:
-                messagebox.showerror("Validation Error", "Please select your project directory.")
+                self._show_error("Validation Error", "Please select your project directory.")
                 return
             
             if not os.path.exists(self.project_path):
-                messagebox.showerror("Validation Error", "Selected directory does not exist.")
+                self._show_error("Validation Error", "Selected directory does not exist.")
                 return
         
         # Move to next step
@@ -780,105 +983,45 @@ the overcast agent accordingly.
     
     def finish_installation(self):
         """Finish the installation and close the app"""
-        messagebox.showinfo(
+        self._show_message(
             "Installation Complete",
-            "Overcast Agent has been successfully installed!\n\n"
+            "🎉 Overcast Agent has been successfully installed!\n\n"
             "Follow the deployment instructions to activate monitoring for your application."
         )
         self.root.quit()
     
     def open_url(self, url: str):
         """Open URL in default browser"""
-        import webbrowser
         webbrowser.open(url)
     
-    def _detect_platform(self) -> Dict[str, Any]:
-        """Detect the current platform and return platform-specific info"""
-        system = platform.system().lower()
-        
-        platform_info = {
-            'system': system,
-            'is_windows': system == 'windows',
-            'is_linux': system == 'linux', 
-            'is_mac': system == 'darwin',
-            'python_cmd': 'python',
-            'shell_cmd': 'bash' if system != 'windows' else 'cmd'
-        }
-        
-        # Determine best Python command
-        if not platform_info['is_windows']:
-            # On Linux/Mac, prefer python3
-            try:
-                import subprocess
-                result = subprocess.run(['python3', '--version'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    platform_info['python_cmd'] = 'python3'
-            except:
-                pass
-        
-        return platform_info
-    
-    def _get_platform_specific_requirements(self) -> str:
-        """Get platform-specific requirements text"""
-        if self.platform_info['is_windows']:
-            return "psutil\nrequests\npython-dotenv"
-        else:
-            # Linux/Mac might need different package names
-            return "psutil\nrequests\npython-dotenv"
-    
-    def _get_platform_docker_cmd(self) -> str:
-        """Get platform-appropriate Docker CMD format"""
-        # All platforms use the same Docker CMD format
-        return 'CMD ["sh", "-c", "python app.py > /app.log 2>&1 & sleep 5 && python overcast_agent.py"]'
-    
     def _get_platform_git_commands(self) -> Dict[str, str]:
         """Get platform-appropriate git commands"""
-        return {
-            'add': 'git add .',
-            'commit': 'git commit -m "Add Overcast agent"',
-            'push': 'git push origin main'
-        }
+        return _GIT_COMMANDS
     
     def run(self):
         """Run the installer application"""
         try:
-            # Center the window
-            self.root.update_idletasks()
-            x = (self.root.winfo_screenwidth() - self.root.winfo_width()) // 2
-            y = (self.root.winfo_screenheight() - self.root.winfo_height()) // 2
-            self.root.geometry(f"+{x}+{y}")
-            
-            # Start the main loop
+            # Start the main loop (the window was already centered in __init__)
             self.root.mainloop()
         
         except KeyboardInterrupt:
             print("Installation cancelled by user.")
-        except Exception as e:
-            messagebox.showerror("Application Error", f"An error occurred: {str(e)}")
 
 
 def main():
     """Main entry point"""
-    platform_name = platform.system()
-    print(f"🚀 Starting Overcast Agent Installer ({platform_name})...")
+    print(f"🚀 Starting Overcast Agent Installer ({platform.system()})...")
     
     # Check Python version
-    if sys.version_info < (3, 9):
+    if sys.version_info < _MIN_PYTHON:
         print("❌ Python 3.9 or higher is required!")
-        if platform.system() == "Windows":
-            input("Press Enter to exit...")
-        else:
-            input("Press Enter to exit...")
+        input("Press Enter to exit...")
         sys.exit(1)
     
     # Show platform-specific compatibility info
-    if platform.system() == "Windows":
-        print("🪟 Windows detected - using Windows-compatible features")
-    elif platform.system() == "Linux": 
-        print("🐧 Linux detected - using cross-platform features")
-    elif platform.system() == "Darwin":
-        print("🍎 macOS detected - using cross-platform features")
+    banner = _PLATFORM_BANNERS.get(sys.platform)
+    if banner:
+        print(banner)
     
     try:
         # Create and run installer
@@ -894,8 +1037,9 @@ def main():
         input("Press Enter to exit...")
         sys.exit(1)
     
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+    except tk.TclError as e:
+        # e.g. no display to open the window on, or Tk failed while running
+        print(f"❌ Installer window error: {e}")
         input("Press Enter to exit...")
         sys.exit(1)
 